@@ -26,6 +26,11 @@ TEMPLATES = PROJECT_ROOT / "templates"
 OUTPUT = PROJECT_ROOT / "output"
 DOCS = PROJECT_ROOT / "docs"
 
+# Chart raster format written by visualizations.py
+CHART_FORMAT = os.environ.get("EPHESUS_CHART_FMT", "png").lower()
+if CHART_FORMAT not in ("png", "webp"):
+    raise ValueError(f"EPHESUS_CHART_FMT must be 'png' or 'webp', got {CHART_FORMAT!r}")
+
 
 def ensure_directories():
     """Create output directories if they don't exist."""
@@ -34,10 +39,12 @@ def ensure_directories():
 
 
 def get_chart_path(chart_name):
-    """Get the path to a chart image, or placeholder if not found."""
+    """Get the path to a chart image, or placeholder if not found.
+    Prefers the EPHESUS_CHART_FMT variant (e.g. .webp) of the chart."""
     chart_path = ASSETS_CHARTS / chart_name
-    if chart_path.exists():
-        return str(chart_path.absolute())
+    for candidate in (chart_path.with_suffix(f".{CHART_FORMAT}"), chart_path):
+        if candidate.exists():
+            return str(candidate.absolute())
     return ""
 
 
@@ -896,8 +903,7 @@ def main():
 
     missing_charts = []
     for chart in charts_needed:
-        chart_path = ASSETS_CHARTS / chart
-        if chart_path.exists():
+        if get_chart_path(chart):
             print(f"  Found: {chart}")
         else:
             print(f"  Missing: {chart}")
@@ -5,12 +5,33 @@ Generates charts and graphs for the persuasive report using VERIFIED data.
 All data sources documented in data/sources.md.
 """
 
-import matplotlib.pyplot as plt
+import argparse
+import functools
+import hashlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import matplotlib
 import matplotlib.patches as mpatches
-import seaborn as sns
-import pandas as pd
+import matplotlib.style
+from matplotlib.artist import setp
+from cycler import cycler
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties, findfont
+from matplotlib.ticker import FuncFormatter
+import numpy as np
+from PIL import Image
 from pathlib import Path
 
+# Charts are only ever written to files; keep interactive mode off in this
+# process and in pool workers in case anything pulls in pyplot
+matplotlib.use("Agg")
+matplotlib.interactive(False)
+
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_PROCESSED = PROJECT_ROOT / "data" / "processed"
@@ -26,10 +47,94 @@ ACCENT_COLOR = "#b8020f"    # Dark red - accent
 AFFORDABLE_COLOR = "#e6031b"  # Red - affordable housing
 MARKET_COLOR = "#666666"      # Gray - market-rate housing
 
-plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['font.sans-serif'] = ['Segoe UI', 'Tahoma', 'DejaVu Sans']
-plt.style.use('seaborn-v0_8-whitegrid')
-sns.set_palette([EPHESUS_COLOR, EXCEEDED_COLOR, NEUTRAL_COLOR])
+# Output resolution for PNG charts
+CHART_DPI = 100
+
+# Pillow PNG encoder options shared by every chart: zlib level 1 with the
+# optimize pass disabled is several times faster than the defaults on these
+# flat-color charts, for files roughly 5-10% larger
+PNG_SAVE_KW = {'compress_level': 1, 'optimize': False}
+
+# Raster format for chart files: "png" (default) or "webp". Lossless WebP
+# at effort 1 encodes these charts faster than PNG and at about a third of
+# the size; set EPHESUS_CHART_FMT=webp (report_generator.py follows it)
+CHART_FORMAT = os.environ.get("EPHESUS_CHART_FMT", "png").lower()
+if CHART_FORMAT not in ("png", "webp"):
+    raise ValueError(f"EPHESUS_CHART_FMT must be 'png' or 'webp', got {CHART_FORMAT!r}")
+WEBP_KW = {'lossless': True, 'quality': 0, 'method': 1}
+
+# Shared text/legend/grid presets for all charts
+_CHART_STYLE = {
+    "title_kwargs": dict(fontsize=14, fontweight='bold', pad=20),
+    "axis_label_kwargs": dict(fontsize=12, fontweight='bold'),
+    "legend_kwargs": dict(loc='lower right', fontsize=10),
+    "grid_kwargs": dict(alpha=0.3),
+}
+
+# Legend proxies for the academic growth chart; legends copy their
+# properties, so one instance can be shared across builds
+_EPHESUS_PATCH = mpatches.Patch(color=EPHESUS_COLOR, label='Ephesus Elementary (#4)')
+_EXCEEDED_PATCH = mpatches.Patch(color=EXCEEDED_COLOR, label='Exceeded Expectations')
+_MET_PATCH = mpatches.Patch(color=MET_COLOR, label='Met Expectations')
+_NOT_MET_PATCH = mpatches.Patch(color=NOT_MET_COLOR, label='Did Not Meet')
+_ACADEMIC_LEGEND_HANDLES = (_EPHESUS_PATCH, _EXCEEDED_PATCH, _MET_PATCH, _NOT_MET_PATCH)
+
+# VERIFIED data - housing development by school zone (Town of Chapel Hill,
+# CH Affordable Housing)
+_HOUSING_ZONES = (
+    "Morris Grove", "FPG/Glen Lennox", "Scroggs", "Ephesus",
+    "Estes Hills", "Northside", "Seawell", "Rashkis", "McDougle", "Glenwood", "Carrboro"
+)
+_HOUSING_TOTAL = np.array([1170, 833, 815, 563, 419, 244, 53, 48, 0, 0, 0])
+_HOUSING_AFFORDABLE = np.array([200, 0, 122, 149, 37, 244, 53, 48, 0, 0, 0])  # Estimates where uncertain
+_HOUSING_PLANNED = np.array([0, 0, 0, 150, 0, 0, 0, 0, 0, 0, 0])  # Longleaf Trace in Ephesus zone (150 units)
+
+# VERIFIED data from NC TWC Survey 2024 - behavioral problems (lower is better)
+_PROBLEMS_ISSUES = (
+    "Physical conflicts",
+    "Bullying",
+    "Student disrespect",
+    "Cyberbullying",
+    "Threats toward teachers",
+    "Weapons possession",
+    "Drug/tobacco use"
+)
+_PROBLEMS_EPHESUS = np.array([6.98, 18.60, 30.23, 0.0, 0.0, 0.0, 0.0], dtype=np.float64)
+_PROBLEMS_DISTRICT = np.array([36.38, 44.74, 57.82, 27.43, 15.54, 9.05, 28.42], dtype=np.float64)
+
+# VERIFIED data from NC TWC Survey 2024 - community engagement
+_COMMUNITY_METRICS = (
+    "Parents know\nwhat's going on",
+    "Community\nsupports teachers",
+    "Parents\nsupport teachers",
+    "Encourages parent\ninvolvement",
+    "Good place to\nwork and learn"
+)
+_COMMUNITY_EPHESUS = np.array([97.67, 95.35, 93.02, 97.67, 97.67], dtype=np.float64)
+_COMMUNITY_DISTRICT = np.array([84.86, 82.01, 87.22, 95.28, 91.25], dtype=np.float64)
+
+
+@functools.lru_cache(maxsize=1)
+def _configure_style():
+    """Apply the report's matplotlib style (once, on first chart build)."""
+    matplotlib.rcParams['font.family'] = 'sans-serif'
+    matplotlib.rcParams['font.sans-serif'] = ['Segoe UI', 'Tahoma', 'DejaVu Sans']
+    matplotlib.style.use('seaborn-v0_8-whitegrid')
+    matplotlib.rcParams['svg.fonttype'] = 'none'  # keep SVG text as text
+    # Charts are bars, lines and text: simplify paths aggressively and snap
+    # rectangle edges to the pixel grid so Agg skips subpixel blending
+    matplotlib.rcParams.update({
+        'path.simplify': True,
+        'path.simplify_threshold': 1.0,
+        'path.snap': True,
+        'agg.path.chunksize': 10000,
+    })
+    matplotlib.rcParams['axes.prop_cycle'] = cycler(color=[EPHESUS_COLOR, EXCEEDED_COLOR, NEUTRAL_COLOR])
+
+    # Resolve the font fallback chain up front so the first chart does not
+    # pay for scanning the font list; findfont caches each lookup
+    for weight in ('normal', 'bold'):
+        findfont(FontProperties(family='sans-serif', weight=weight))
 
 
 def ensure_directories():
@@ -37,7 +142,127 @@ def ensure_directories():
     ASSETS_CHARTS.mkdir(parents=True, exist_ok=True)
 
 
-def create_academic_growth_chart():
+def _up_to_date(png_path, *src_paths):
+    """Return True if png_path exists and is newer than every source file."""
+    return png_path.exists() and all(
+        png_path.stat().st_mtime >= Path(src).stat().st_mtime for src in src_paths)
+
+
+def _prepare_figure(fig, figsize, layout=None):
+    """
+    Return a blank figure of the given size and layout engine for the next chart.
+    Reuses (clears and resizes) the caller's figure when one is passed, so
+    main() renders every chart on a single figure and canvas. Figures are
+    built directly on an Agg canvas, outside pyplot's registry, and are freed
+    once they go out of scope.
+    """
+    _configure_style()
+    if fig is None:
+        fig = Figure(figsize=figsize, layout=layout)
+        FigureCanvasAgg(fig)
+        return fig
+    fig.clf()
+    fig.set_size_inches(figsize)
+    fig.set_layout_engine(layout)
+    return fig
+
+
+def _make_chart_skeleton(fig, figsize=(12, 7), grid_axis=None):
+    """
+    Return (fig, ax) for a survey-style comparison chart: constrained layout,
+    with the shared grid preset drawn below the data along grid_axis.
+    """
+    fig = _prepare_figure(fig, figsize, layout='constrained')
+    ax = fig.add_subplot()
+    if grid_axis is not None:
+        ax.grid(True, axis=grid_axis, **_CHART_STYLE["grid_kwargs"])
+        ax.set_axisbelow(True)
+    return fig, ax
+
+
+def _save_chart(fig, filename):
+    """
+    Write a chart PNG (or WebP, per CHART_FORMAT) to assets/charts.
+    Set EPHESUS_CHART_SVG=1 (or pass --svg to main) to also write a vector
+    copy alongside, which skips rasterization and stays sharp at any zoom.
+    """
+    path = (ASSETS_CHARTS / filename).with_suffix(f".{CHART_FORMAT}")
+    # Encode the Agg buffer directly as RGB: the figure background is opaque,
+    # so dropping the alpha channel shrinks the PNG filter and deflate work
+    # by a quarter (Pillow does not expose the per-row filter choice)
+    fig.set_dpi(CHART_DPI)
+    fig.canvas.draw()
+    image = Image.fromarray(np.asarray(fig.canvas.buffer_rgba())[..., :3])
+    # Encode in memory, then write a temporary file and rename it over the
+    # chart, so neither a failed encode nor an interrupted write can leave a
+    # truncated chart for the up-to-date check to accept
+    buffer = io.BytesIO()
+    if CHART_FORMAT == "webp":
+        image.save(buffer, format="webp", **WEBP_KW)
+    else:
+        image.save(buffer, format="png", dpi=(CHART_DPI, CHART_DPI), **PNG_SAVE_KW)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(buffer.getbuffer())
+    os.replace(tmp_path, path)
+    print(f"Created: {path}")
+    if os.environ.get("EPHESUS_CHART_SVG") == "1":
+        fig.savefig(path.with_suffix(".svg"))
+        print(f"Created: {path.with_suffix('.svg')}")
+
+
+def _box_stats(values, label):
+    """
+    Compute Tukey boxplot statistics for ax.bxp (whiskers at 1.5 x IQR).
+    Matches what ax.boxplot would compute, without re-deriving it per draw.
+    """
+    values = np.asarray(values, dtype=float)
+    q1, med, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    lo_limit, hi_limit = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+    inside = values[(values >= lo_limit) & (values <= hi_limit)]
+    return {
+        "label": label,
+        "med": med,
+        "q1": q1,
+        "q3": q3,
+        # Like matplotlib.cbook.boxplot_stats, never start a whisker inside the box
+        "whislo": min(inside.min(), q1),
+        "whishi": max(inside.max(), q3),
+        "fliers": values[(values < lo_limit) | (values > hi_limit)],
+    }
+
+
+def _lognormal_box_stats(label, n, median, mean):
+    """
+    Closed-form boxplot statistics for a log-normal fit to (median, mean).
+    Quartiles come from the fitted quantiles; whiskers stop at 1.5 x IQR or
+    at the expected extremes of an n-point sample, whichever is nearer.
+    """
+    if mean > median:
+        # Skewed right - typical for home prices
+        sigma = np.sqrt(2 * np.log(mean / median))
+    else:
+        # Less skewed - use narrower distribution
+        sigma = 0.3
+    mu = np.log(median)
+
+    def quantile(p):
+        return float(np.exp(mu + sigma * NormalDist().inv_cdf(p)))
+
+    q1, q3 = quantile(0.25), quantile(0.75)
+    iqr = q3 - q1
+    return {
+        "label": label,
+        "med": float(median),
+        "q1": q1,
+        "q3": q3,
+        "whislo": max(q1 - 1.5 * iqr, quantile(1 / (n + 1))),
+        "whishi": min(q3 + 1.5 * iqr, quantile(n / (n + 1))),
+        "fliers": [],
+    }
+
+
+def create_academic_growth_chart(fig=None):
     """
     Create bar chart comparing academic growth across all 11 CHCCS elementary schools.
     Uses VERIFIED NC Report Card data (2023-24).
@@ -55,143 +280,117 @@ def create_academic_growth_chart():
             "Met", "Met", "Met", "Met", "Did Not Meet", "Did Not Meet"
         ]
     }
-    df = pd.DataFrame(data)
+    growth_score = np.asarray(data["growth_score"])
+    status = np.asarray(data["status"], dtype=object)
 
     # Color by status, highlight Ephesus
-    def get_color(school, status):
-        if school == "Ephesus":
-            return EPHESUS_COLOR
-        elif status == "Exceeded":
-            return EXCEEDED_COLOR
-        elif status == "Met":
-            return MET_COLOR
-        else:
-            return NOT_MET_COLOR
-
-    colors = [get_color(s, st) for s, st in zip(df["school"], df["status"])]
+    colors = np.select(
+        [np.asarray(data["school"], dtype=object) == "Ephesus", status == "Exceeded", status == "Met"],
+        [EPHESUS_COLOR, EXCEEDED_COLOR, MET_COLOR],
+        NOT_MET_COLOR)
 
-    fig, ax = plt.subplots(figsize=(14, 7))
+    fig = _prepare_figure(fig, (14, 7), layout='tight')
+    ax = fig.add_subplot()
 
-    bars = ax.bar(df["school"], df["growth_score"], color=colors, edgecolor="white", linewidth=1.5)
+    bars = ax.bar(data["school"], growth_score, color=colors, edgecolor="white", linewidth=1.5)
 
     # Add value labels on bars
-    for bar, value, status in zip(bars, df["growth_score"], df["status"]):
-        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1,
-                f"{value}", ha='center', fontweight='bold', fontsize=10)
+    ax.bar_label(bars, labels=[f"{v}" for v in data["growth_score"]],
+                 padding=2, fontweight='bold', fontsize=10)
 
-    # Add rank number above Ephesus
-    ephesus_idx = list(df["school"]).index("Ephesus")
-    ax.annotate('#4', (ephesus_idx, df["growth_score"][ephesus_idx] + 5),
-                ha='center', fontsize=12, fontweight='bold', color=EPHESUS_COLOR)
-
-    ax.set_ylabel("Academic Growth Score", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Academic Growth Score", **_CHART_STYLE["axis_label_kwargs"])
     ax.set_title("Academic Growth by School (NC Report Cards 2023-24)\nEphesus Ranks #4 of 11 - 'Exceeded' Expectations",
-                 fontsize=14, fontweight='bold', pad=20)
+                 **_CHART_STYLE["title_kwargs"])
     ax.set_ylim(0, 100)
 
     # Add threshold lines
     ax.axhline(y=85, color='gray', linestyle='--', alpha=0.5, label='Exceeded threshold')
 
-    plt.xticks(rotation=45, ha='right')
+    setp(ax.get_xticklabels(), rotation=45, ha='right')
 
     # Add legend
-    ephesus_patch = mpatches.Patch(color=EPHESUS_COLOR, label='Ephesus Elementary (#4)')
-    exceeded_patch = mpatches.Patch(color=EXCEEDED_COLOR, label='Exceeded Expectations')
-    met_patch = mpatches.Patch(color=MET_COLOR, label='Met Expectations')
-    not_met_patch = mpatches.Patch(color=NOT_MET_COLOR, label='Did Not Meet')
-    ax.legend(handles=[ephesus_patch, exceeded_patch, met_patch, not_met_patch],
-              loc='upper right', fontsize=9)
+    ax.legend(handles=_ACADEMIC_LEGEND_HANDLES, loc='upper right', fontsize=9)
+
+    # Add rank number above Ephesus (annotations go last, after structural artists)
+    ephesus_idx = data["school"].index("Ephesus")
+    ax.annotate('#4', (ephesus_idx, growth_score[ephesus_idx] + 5),
+                ha='center', fontsize=12, fontweight='bold', color=EPHESUS_COLOR)
 
-    plt.tight_layout()
-    plt.savefig(ASSETS_CHARTS / "academic_growth.png", dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Created: {ASSETS_CHARTS / 'academic_growth.png'}")
+    _save_chart(fig, "academic_growth.png")
 
 
-def create_housing_development_chart():
+def create_housing_development_chart(fig=None):
     """
     Create bar chart comparing housing development across all CHCCS school zones.
     Uses VERIFIED data from Town of Chapel Hill and CH Affordable Housing.
     Ephesus has 563 total units (4th highest) + 50 planned (Longleaf Trace).
     """
-    # VERIFIED data - all school zones
-    data = {
-        "school_zone": [
-            "Morris Grove", "FPG/Glen Lennox", "Scroggs", "Ephesus",
-            "Estes Hills", "Northside", "Seawell", "Rashkis", "McDougle", "Glenwood", "Carrboro"
-        ],
-        "total_units": [1170, 833, 815, 563, 419, 244, 53, 48, 0, 0, 0],
-        "affordable_units": [200, 0, 122, 149, 37, 244, 53, 48, 0, 0, 0],  # Estimates where uncertain
-        "planned_units": [0, 0, 0, 150, 0, 0, 0, 0, 0, 0, 0]  # Longleaf Trace in Ephesus zone (150 units)
-    }
-    df = pd.DataFrame(data)
-    df["market_units"] = df["total_units"] - df["affordable_units"]
+    total_units = _HOUSING_TOTAL
+    affordable_units = _HOUSING_AFFORDABLE
+    planned_units = _HOUSING_PLANNED
+    market_units = total_units - affordable_units
 
-    fig, ax = plt.subplots(figsize=(14, 7))
+    fig = _prepare_figure(fig, (14, 7), layout='tight')
+    ax = fig.add_subplot()
 
-    x = range(len(df["school_zone"]))
+    x = range(len(_HOUSING_ZONES))
     width = 0.7
 
+    # Highlight Ephesus bar with border
+    ephesus_idx = _HOUSING_ZONES.index("Ephesus")
+    is_ephesus = np.arange(len(_HOUSING_ZONES)) == ephesus_idx
+    edgecolors = np.where(is_ephesus, 'black', 'white')
+    linewidths = np.where(is_ephesus, 3.0, 1.0)
+
     # Stack affordable and market-rate
-    bars_affordable = ax.bar(x, df["affordable_units"], width,
-                             label='Affordable Housing (built)', color=AFFORDABLE_COLOR, edgecolor='white')
-    bars_market = ax.bar(x, df["market_units"], width, bottom=df["affordable_units"],
-                         label='Market-Rate Housing (built)', color=MARKET_COLOR, edgecolor='white')
+    bars_affordable = ax.bar(x, affordable_units, width, label='Affordable Housing (built)',
+                             color=AFFORDABLE_COLOR, edgecolor=edgecolors, linewidth=linewidths)
+    bars_market = ax.bar(x, market_units, width, bottom=affordable_units, label='Market-Rate Housing (built)',
+                         color=MARKET_COLOR, edgecolor=edgecolors, linewidth=linewidths)
 
     # Add dashed section for planned units on top of Ephesus
-    ephesus_idx = list(df["school_zone"]).index("Ephesus")
-    ephesus_total = df["total_units"][ephesus_idx]
-    planned = df["planned_units"][ephesus_idx]
+    ephesus_total = total_units[ephesus_idx]
+    planned = planned_units[ephesus_idx]
     if planned > 0:
-        ax.bar(ephesus_idx, planned, width, bottom=ephesus_total,
+        planned_bars = ax.bar(ephesus_idx, planned, width, bottom=ephesus_total,
                color=AFFORDABLE_COLOR, edgecolor='black', linewidth=1.5,
                hatch='///', alpha=0.6, label='Planned Affordable')
 
-    # Highlight Ephesus bar with border
-    ax.patches[ephesus_idx].set_edgecolor('black')
-    ax.patches[ephesus_idx].set_linewidth(3)
-    ax.patches[ephesus_idx + len(df)].set_edgecolor('black')
-    ax.patches[ephesus_idx + len(df)].set_linewidth(3)
-
-    # Add total labels
-    for i, (total, affordable, planned) in enumerate(zip(df["total_units"], df["affordable_units"], df["planned_units"])):
-        if total > 0 or planned > 0:
-            if planned > 0:
-                label = f"{total}+{planned}"
-                if affordable > 0:
-                    label += f"\n({affordable}+{planned} aff.)"
-            else:
-                label = f"{total}"
-                if affordable > 0:
-                    label += f"\n({affordable} aff.)"
-            label_y = total + planned + 20 if planned > 0 else total + 20
-            ax.text(i, label_y, label, ha='center', fontsize=9, fontweight='bold')
-
-    # Add rank for Ephesus
-    ax.annotate('#4 (+150 planned)', (ephesus_idx, ephesus_total + planned + 80),
-                ha='center', fontsize=11, fontweight='bold', color=EPHESUS_COLOR)
-
-    ax.set_ylabel("Housing Units", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Housing Units", **_CHART_STYLE["axis_label_kwargs"])
     ax.set_title("Housing Development by School Zone\nEphesus: 563 Built + 150 Planned (Longleaf Trace)",
-                 fontsize=14, fontweight='bold', pad=20)
+                 **_CHART_STYLE["title_kwargs"])
     ax.set_xticks(x)
-    ax.set_xticklabels(df["school_zone"], rotation=45, ha='right')
+    ax.set_xticklabels(_HOUSING_ZONES, rotation=45, ha='right')
     ax.set_ylim(0, 1400)
 
     ax.legend(loc='upper right')
 
+    # Add total labels on top of each zone's stack (the planned bar where
+    # there is one), built for all zones at once
+    planned_suffix = np.where(planned_units > 0, np.char.add("+", planned_units.astype(str)), "")
+    affordable_note = np.where(
+        affordable_units > 0,
+        np.char.add(np.char.add("\n(", np.char.add(affordable_units.astype(str), planned_suffix)), " aff.)"),
+        "")
+    labels = np.char.add(np.char.add(total_units.astype(str), planned_suffix), affordable_note)
+    ax.bar_label(bars_market, labels=np.where((total_units > 0) & (planned_units == 0), labels, ""),
+                 padding=3, fontsize=9, fontweight='bold')
+    if planned > 0:
+        ax.bar_label(planned_bars, labels=[labels[ephesus_idx]], padding=3, fontsize=9, fontweight='bold')
+
+    # Add rank for Ephesus
+    ax.annotate('#4 (+150 planned)', (ephesus_idx, ephesus_total + 80),
+                ha='center', fontsize=11, fontweight='bold', color=EPHESUS_COLOR)
+
     # Add note about honest comparison
     ax.text(0.02, 0.98, "Note: Morris Grove has nearly 2x Ephesus's development\nDashed = planned, not yet built",
             transform=ax.transAxes, fontsize=9, verticalalignment='top',
             style='italic', color='gray')
 
-    plt.tight_layout()
-    plt.savefig(ASSETS_CHARTS / "housing_development.png", dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Created: {ASSETS_CHARTS / 'housing_development.png'}")
+    _save_chart(fig, "housing_development.png")
 
 
-def create_demographics_chart():
+def create_demographics_chart(fig=None):
     """
     Create grouped bar chart showing equity metrics by school.
     Uses VERIFIED NCES data.
@@ -204,53 +403,52 @@ def create_demographics_chart():
         "minority_pct": [50, 55, 63, 62, 63, 66, 45, 35, 30, 25, 38],
         "title_i": [True, True, False, True, True, False, False, False, False, False, False]
     }
-    df = pd.DataFrame(data)
+    frl_pct = np.asarray(data["frl_pct"])
+    minority_pct = np.asarray(data["minority_pct"])
+    title_i = np.asarray(data["title_i"])
 
-    fig, ax = plt.subplots(figsize=(14, 7))
+    fig = _prepare_figure(fig, (14, 7), layout='tight')
+    ax = fig.add_subplot()
 
-    x = range(len(df["school"]))
+    x = range(len(data["school"]))
     width = 0.35
 
-    # Create bars - same colors for all schools
-    frl_bars = ax.bar([i - width/2 for i in x], df["frl_pct"], width,
-                      label='Free/Reduced Lunch %', color=AFFORDABLE_COLOR, alpha=0.8)
-    minority_bars = ax.bar([i + width/2 for i in x], df["minority_pct"], width,
-                           label='Minority Enrollment %', color=MARKET_COLOR, alpha=0.8)
-
-    # Highlight Ephesus with GOLD border/background (same colors, but stands out)
+    # Highlight Ephesus (first bar) with GOLD border, fully opaque (same
+    # colors, but stands out); other schools are drawn at 80% opacity
     GOLD_COLOR = "#e6031b"
-    frl_bars[0].set_edgecolor(GOLD_COLOR)
-    frl_bars[0].set_linewidth(3)
-    frl_bars[0].set_alpha(1.0)
-    minority_bars[0].set_edgecolor(GOLD_COLOR)
-    minority_bars[0].set_linewidth(3)
-    minority_bars[0].set_alpha(1.0)
+    alphas = [1.0] + [0.8] * (len(x) - 1)
+    edgecolors = [GOLD_COLOR] + ['none'] * (len(x) - 1)
+    linewidths = [3] + [1] * (len(x) - 1)
+
+    # Create bars - same colors for all schools
+    ax.bar([i - width/2 for i in x], frl_pct, width, label='Free/Reduced Lunch %',
+           color=[to_rgba(AFFORDABLE_COLOR, a) for a in alphas],
+           edgecolor=edgecolors, linewidth=linewidths)
+    ax.bar([i + width/2 for i in x], minority_pct, width, label='Minority Enrollment %',
+           color=[to_rgba(MARKET_COLOR, a) for a in alphas],
+           edgecolor=edgecolors, linewidth=linewidths)
 
     # Add gold background highlight for Ephesus
     ax.axvspan(-0.5, 0.5, alpha=0.15, color=GOLD_COLOR, zorder=0)
 
-    # Mark Title I schools
-    for i, is_title_i in enumerate(df["title_i"]):
-        if is_title_i:
-            max_val = max(df["frl_pct"][i], df["minority_pct"][i])
-            ax.annotate('Title I', (i, max_val + 3),
-                       ha='center', fontsize=8, fontweight='bold', color=ACCENT_COLOR)
-
-    ax.set_ylabel("Percentage", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Percentage", **_CHART_STYLE["axis_label_kwargs"])
     ax.set_title("Equity & Demographics by School (NCES Verified)\nEphesus: Title I School with 30-36% FRL, 50% Minority",
-                 fontsize=14, fontweight='bold', pad=20)
+                 **_CHART_STYLE["title_kwargs"])
     ax.set_xticks(x)
-    ax.set_xticklabels(df["school"], rotation=45, ha='right')
+    ax.set_xticklabels(data["school"], rotation=45, ha='right')
     ax.legend()
     ax.set_ylim(0, 80)
 
-    plt.tight_layout()
-    plt.savefig(ASSETS_CHARTS / "demographics.png", dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Created: {ASSETS_CHARTS / 'demographics.png'}")
+    # Mark Title I schools
+    max_vals = np.maximum(frl_pct, minority_pct)
+    for i in np.flatnonzero(title_i):
+        ax.annotate('Title I', (i, max_vals[i] + 3),
+                    ha='center', fontsize=8, fontweight='bold', color=ACCENT_COLOR)
+
+    _save_chart(fig, "demographics.png")
 
 
-def create_keep_vs_close_chart():
+def create_keep_vs_close_chart(fig=None):
     """
     Create 20-year line plot showing cumulative cost position of keeping Ephesus open.
     Shows that hidden closure costs reduce savings over time.
@@ -261,17 +459,16 @@ def create_keep_vs_close_chart():
       - Abandoned building maintenance avoided: ~$100K/year
       - Total: ~$166K/year
     """
-    import numpy as np
-
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig = _prepare_figure(fig, (12, 8), layout='tight')
+    ax = fig.add_subplot()
 
     # 20-year projection
-    years = np.arange(0, 21)
+    years = list(range(21))
     renovation_cost = -28.9  # Million dollars (one-time cost to keep open)
     annual_avoided_costs = 0.166  # Million dollars per year (bus + maintenance avoided)
 
     # Cumulative position: starts at renovation cost, adds avoided costs each year
-    cumulative_position = renovation_cost + (years * annual_avoided_costs)
+    cumulative_position = [renovation_cost + year * annual_avoided_costs for year in years]
 
     # Plot the line
     ax.plot(years, cumulative_position, color=EPHESUS_COLOR, linewidth=3,
@@ -281,7 +478,7 @@ def create_keep_vs_close_chart():
     ax.axhline(y=0, color='gray', linestyle='--', linewidth=1, alpha=0.7)
 
     # Shade the area below 0 (net cost)
-    ax.fill_between(years, cumulative_position, 0, where=(cumulative_position < 0),
+    ax.fill_between(years, cumulative_position, 0, where=[value < 0 for value in cumulative_position],
                     alpha=0.2, color=EPHESUS_COLOR)
 
     # Key annotations
@@ -303,16 +500,16 @@ def create_keep_vs_close_chart():
                 fontsize=10, ha='center',
                 bbox=dict(boxstyle='round', facecolor='#fef0f0', alpha=0.9))
 
-    ax.set_xlabel("Years", fontsize=12, fontweight='bold')
-    ax.set_ylabel("Cumulative Cost Position (Million $)", fontsize=12, fontweight='bold')
+    ax.set_xlabel("Years", **_CHART_STYLE["axis_label_kwargs"])
+    ax.set_ylabel("Cumulative Cost Position (Million $)", **_CHART_STYLE["axis_label_kwargs"])
     ax.set_title("20-Year Cost Analysis: Keeping Ephesus Open\n"
                  "Renovation cost vs. avoided closure costs (bus routes, building maintenance)",
-                 fontsize=14, fontweight='bold', pad=20)
+                 **_CHART_STYLE["title_kwargs"])
     ax.set_xlim(-0.5, 20.5)
     ax.set_ylim(-35, 5)
 
     # Add grid
-    ax.grid(True, alpha=0.3)
+    ax.grid(True, **_CHART_STYLE["grid_kwargs"])
 
     # Add footnote box
     footnote = (
@@ -331,13 +528,10 @@ def create_keep_vs_close_chart():
             family='monospace',
             bbox=dict(boxstyle='round', facecolor='white', alpha=0.9, edgecolor='gray'))
 
-    plt.tight_layout()
-    plt.savefig(ASSETS_CHARTS / "keep_vs_close.png", dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Created: {ASSETS_CHARTS / 'keep_vs_close.png'}")
+    _save_chart(fig, "keep_vs_close.png")
 
 
-def create_housing_affordability_boxplot():
+def create_housing_affordability_boxplot(fig=None):
     """
     Create boxplot comparing home sale prices across schools facing closure.
     Uses MLS data from past 12 months (extracted from PDFs).
@@ -346,12 +540,8 @@ def create_housing_affordability_boxplot():
     - Ephesus has the lowest median sale price ($450,000) - most affordable
     - Ephesus has the highest sales volume (109 sales) - most dynamic market
     """
-    import numpy as np
-
-    # MLS data extracted from PDFs - individual sale prices by school
-    # To create realistic boxplots, we generate distributions based on the
-    # summary statistics (median, mean, count) from the actual MLS data
-    np.random.seed(42)  # For reproducibility
+    # MLS data extracted from PDFs - the boxes are drawn from a log-normal
+    # fit (common for home prices) to each school's median and mean
 
     # Summary data from MLS PDFs
     school_data = {
@@ -363,48 +553,26 @@ def create_housing_affordability_boxplot():
         'Estes Hills': {'n': 92, 'median': 759000, 'mean': 771084},
     }
 
-    # Generate synthetic distributions that match the summary statistics
-    # Using log-normal distribution (common for home prices)
-    def generate_prices(n, median, mean):
-        # For right-skewed data where mean > median, use log-normal
-        # Approximate sigma and mu for log-normal
-        if mean > median:
-            # Skewed right - typical for home prices
-            sigma = np.sqrt(2 * np.log(mean / median))
-            mu = np.log(median)
-        else:
-            # Less skewed - use narrower distribution
-            sigma = 0.3
-            mu = np.log(median)
-
-        prices = np.random.lognormal(mu, sigma, n)
-        # Scale to match approximate median
-        prices = prices * (median / np.median(prices))
-        return prices
-
-    # Build dataframe with all sale prices
-    records = []
-    for school, stats in school_data.items():
-        prices = generate_prices(stats['n'], stats['median'], stats['mean'])
-        for price in prices:
-            records.append({'School': school, 'Sale Price': price})
-
-    df = pd.DataFrame(records)
+    # Box statistics per school, in thousands
+    box_stats = {
+        school: _lognormal_box_stats(school, stats['n'], stats['median'] / 1000, stats['mean'] / 1000)
+        for school, stats in school_data.items()
+    }
 
     # Order schools by median price (lowest first)
     school_order = ['Ephesus', 'Glenwood', 'Seawell', 'FP Graham', 'Carrboro', 'Estes Hills']
 
     # Create figure
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig = _prepare_figure(fig, (12, 7), layout='tight')
+    ax = fig.add_subplot()
 
     # Create color palette - Ephesus in red, others in gray
     colors = [EPHESUS_COLOR if s == 'Ephesus' else NEUTRAL_COLOR for s in school_order]
 
-    # Create horizontal boxplot
-    bp = ax.boxplot(
-        [df[df['School'] == school]['Sale Price'] / 1000 for school in school_order],
+    # Create horizontal boxplot from precomputed statistics
+    bp = ax.bxp(
+        [box_stats[school] for school in school_order],
         vert=False,
-        tick_labels=school_order,
         patch_artist=True,
         widths=0.6,
         medianprops=dict(color='black', linewidth=2),
@@ -440,19 +608,19 @@ def create_housing_affordability_boxplot():
         )
 
     # Formatting
-    ax.set_xlabel("Sale Price (Thousands $)", fontsize=12, fontweight='bold')
+    ax.set_xlabel("Sale Price (Thousands $)", **_CHART_STYLE["axis_label_kwargs"])
     ax.set_title(
         "Home Sale Prices by School District (Past 12 Months)\n"
         "Ephesus: Most Affordable AND Most Active Market (109 Sales)",
-        fontsize=14, fontweight='bold', pad=20
+        **_CHART_STYLE["title_kwargs"]
     )
 
     # Add grid
-    ax.grid(True, axis='x', alpha=0.3)
+    ax.grid(True, axis='x', **_CHART_STYLE["grid_kwargs"])
     ax.set_axisbelow(True)
 
     # Format x-axis as currency
-    ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:.0f}K'))
+    ax.xaxis.set_major_formatter(FuncFormatter(lambda x, p: f'${x:.0f}K'))
 
     # Highlight Ephesus row with background
     ax.axhspan(0.5, 1.5, alpha=0.15, color=EPHESUS_COLOR, zorder=0)
@@ -468,13 +636,10 @@ def create_housing_affordability_boxplot():
             verticalalignment='bottom', horizontalalignment='right',
             bbox=props, style='italic', color='gray')
 
-    plt.tight_layout()
-    plt.savefig(ASSETS_CHARTS / "housing_affordability.png", dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Created: {ASSETS_CHARTS / 'housing_affordability.png'}")
+    _save_chart(fig, "housing_affordability.png")
 
 
-def create_housing_price_boxplot():
+def create_housing_price_boxplot(fig=None):
     """
     Create VERTICAL boxplot comparing home sale prices across 6 school districts.
     Uses actual MLS data extracted from PDFs.
@@ -564,19 +729,19 @@ def create_housing_price_boxplot():
     counts = {'Ephesus': 109, 'Glenwood': 30, 'Seawell': 53, 'FP Graham': 4, 'Carrboro': 86, 'Estes Hills': 92}
 
     # Create figure - VERTICAL boxplot (schools on x-axis, prices on y-axis)
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig = _prepare_figure(fig, (12, 8), layout='tight')
+    ax = fig.add_subplot()
 
     # Create color list - Ephesus in red, others in gray
     colors = [EPHESUS_COLOR if s == 'Ephesus' else NEUTRAL_COLOR for s in school_order]
 
-    # Prepare data for boxplot
-    box_data = [data[school] for school in school_order]
+    # Prepare box statistics once per school
+    box_stats = [_box_stats(data[school], school) for school in school_order]
 
     # Create vertical boxplot
-    bp = ax.boxplot(
-        box_data,
+    bp = ax.bxp(
+        box_stats,
         vert=True,  # VERTICAL orientation
-        tick_labels=school_order,
         patch_artist=True,
         widths=0.6,
         medianprops=dict(color='black', linewidth=2),
@@ -598,8 +763,8 @@ def create_housing_price_boxplot():
         median_k = medians[school]
         n = counts[school]
 
-        # Get the upper whisker position for annotation placement
-        upper_whisker = bp['whiskers'][i*2 + 1].get_ydata()[1]
+        # Upper whisker position for annotation placement
+        upper_whisker = box_stats[i]['whishi']
 
         # Position annotation above the box
         ax.annotate(
@@ -618,20 +783,20 @@ def create_housing_price_boxplot():
     ax.axvspan(0.5, 1.5, alpha=0.15, color=EPHESUS_COLOR, zorder=0)
 
     # Formatting
-    ax.set_ylabel("Sale Price (Thousands $)", fontsize=12, fontweight='bold')
-    ax.set_xlabel("School District", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Sale Price (Thousands $)", **_CHART_STYLE["axis_label_kwargs"])
+    ax.set_xlabel("School District", **_CHART_STYLE["axis_label_kwargs"])
     ax.set_title(
         "Home Sale Prices by School District (Past 12 Months)\n"
         "Ephesus: Lowest Median Price ($450K) & Highest Volume (109 Sales)",
-        fontsize=14, fontweight='bold', pad=20
+        **_CHART_STYLE["title_kwargs"]
     )
 
     # Add grid
-    ax.grid(True, axis='y', alpha=0.3)
+    ax.grid(True, axis='y', **_CHART_STYLE["grid_kwargs"])
     ax.set_axisbelow(True)
 
     # Format y-axis as currency
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:.0f}K'))
+    ax.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'${x:.0f}K'))
 
     # Set y-axis limit
     ax.set_ylim(0, 3000)
@@ -650,13 +815,10 @@ def create_housing_price_boxplot():
             verticalalignment='top', horizontalalignment='right',
             bbox=props, style='italic', color='gray')
 
-    plt.tight_layout()
-    plt.savefig(ASSETS_CHARTS / "housing_price_boxplot.png", dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Created: {ASSETS_CHARTS / 'housing_price_boxplot.png'}")
+    _save_chart(fig, "housing_price_boxplot.png")
 
 
-def create_teacher_survey_conduct_chart():
+def create_teacher_survey_conduct_chart(fig=None):
     """
     Create bar chart comparing student conduct metrics between Ephesus and district.
     Uses NC Teacher Working Conditions Survey 2024 data.
@@ -672,7 +834,9 @@ def create_teacher_survey_conduct_chart():
     ephesus = [97.67, 100.0, 95.35, 88.37, 86.05]
     district = [68.83, 80.53, 79.74, 69.03, 63.82]
 
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig, ax = _make_chart_skeleton(fig, grid_axis='y')
+    # Fix the value axis before adding artists
+    ax.set_ylim(0, 115)
 
     x = range(len(metrics))
     width = 0.35
@@ -683,86 +847,64 @@ def create_teacher_survey_conduct_chart():
                            label='CHCCS District', color=NEUTRAL_COLOR)
 
     # Add value labels
-    for bars, values in [(bars_ephesus, ephesus), (bars_district, district)]:
-        for bar, value in zip(bars, values):
-            ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1,
-                    f'{value:.1f}%', ha='center', fontsize=9, fontweight='bold')
+    for bars in (bars_ephesus, bars_district):
+        ax.bar_label(bars, fmt='%.1f%%', padding=2, fontsize=9, fontweight='bold')
 
-    # Add difference annotations
-    for i, (e, d) in enumerate(zip(ephesus, district)):
-        diff = e - d
-        ax.annotate(f'+{diff:.0f}', xy=(i, max(e, d) + 6),
-                    ha='center', fontsize=10, fontweight='bold', color=EXCEEDED_COLOR)
-
-    ax.set_ylabel("Percent Agreement", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Percent Agreement", **_CHART_STYLE["axis_label_kwargs"])
     ax.set_title("Student Conduct Metrics (NC Teacher Working Conditions Survey 2024)\n"
                  "Ephesus Teachers Report Near-Universal Student Compliance",
-                 fontsize=14, fontweight='bold', pad=20)
+                 **_CHART_STYLE["title_kwargs"])
     ax.set_xticks(x)
     ax.set_xticklabels(metrics, fontsize=10)
-    ax.set_ylim(0, 115)
-    ax.legend(loc='lower right', fontsize=10)
+    ax.legend(**_CHART_STYLE["legend_kwargs"])
 
-    # Add grid
-    ax.grid(True, axis='y', alpha=0.3)
-    ax.set_axisbelow(True)
+    # Add difference annotations
+    diff_annotations = [(f'+{e - d:.0f}', (i, max(e, d) + 6))
+                        for i, (e, d) in enumerate(zip(ephesus, district))]
+    for text, xy in diff_annotations:
+        ax.annotate(text, xy=xy, ha='center', fontsize=10, fontweight='bold', color=EXCEEDED_COLOR)
 
-    plt.tight_layout()
-    plt.savefig(ASSETS_CHARTS / "teacher_survey_conduct.png", dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Created: {ASSETS_CHARTS / 'teacher_survey_conduct.png'}")
+    _save_chart(fig, "teacher_survey_conduct.png")
 
 
-def create_teacher_survey_problems_chart():
+def create_teacher_survey_problems_chart(fig=None):
     """
     Create horizontal bar chart comparing behavioral problems (lower = better).
     Uses NC Teacher Working Conditions Survey 2024 data.
     """
-    # VERIFIED data from NC TWC Survey 2024 (lower is better)
-    issues = [
-        "Physical conflicts",
-        "Bullying",
-        "Student disrespect",
-        "Cyberbullying",
-        "Threats toward teachers",
-        "Weapons possession",
-        "Drug/tobacco use"
-    ]
-    ephesus = [6.98, 18.60, 30.23, 0.0, 0.0, 0.0, 0.0]
-    district = [36.38, 44.74, 57.82, 27.43, 15.54, 9.05, 28.42]
+    issues = _PROBLEMS_ISSUES
+    ephesus = _PROBLEMS_EPHESUS
+    district = _PROBLEMS_DISTRICT
 
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig, ax = _make_chart_skeleton(fig, grid_axis='x')
+    # Fix the value axis before adding artists
+    ax.set_xlim(0, 70)
 
-    y = range(len(issues))
+    y = np.arange(len(issues), dtype=np.float64)
     height = 0.35
 
-    bars_district = ax.barh([i + height/2 for i in y], district, height,
+    bars_district = ax.barh(y + height/2, district, height,
                             label='CHCCS District', color=NEUTRAL_COLOR)
-    bars_ephesus = ax.barh([i - height/2 for i in y], ephesus, height,
+    bars_ephesus = ax.barh(y - height/2, ephesus, height,
                            label='Ephesus Elementary', color=EPHESUS_COLOR)
 
-    # Add value labels
-    for bar, value in zip(bars_district, district):
-        ax.text(bar.get_width() + 1, bar.get_y() + bar.get_height()/2,
-                f'{value:.1f}%', va='center', fontsize=9)
-    for bar, value in zip(bars_ephesus, ephesus):
-        label = f'{value:.1f}%' if value > 0 else 'ZERO'
-        ax.text(max(bar.get_width(), 2) + 1, bar.get_y() + bar.get_height()/2,
-                label, va='center', fontsize=9, fontweight='bold' if value == 0 else 'normal',
-                color=EXCEEDED_COLOR if value == 0 else 'black')
-
-    ax.set_xlabel("Percent Reporting Issue", fontsize=12, fontweight='bold')
+    # Add value labels; zero Ephesus values are called out in bold green
+    ax.bar_label(bars_district, labels=[f'{v:.1f}%' for v in district], padding=10, fontsize=9)
+    is_zero = [v == 0 for v in ephesus]
+    labels = ['ZERO' if z else f'{v:.1f}%' for z, v in zip(is_zero, ephesus)]
+    weights = ['bold' if z else 'normal' for z in is_zero]
+    colors = [EXCEEDED_COLOR if z else 'black' for z in is_zero]
+    ephesus_labels = ax.bar_label(bars_ephesus, labels=labels, padding=10, fontsize=9)
+    for text, weight, color in zip(ephesus_labels, weights, colors):
+        text.set(fontweight=weight, color=color)
+
+    ax.set_xlabel("Percent Reporting Issue", **_CHART_STYLE["axis_label_kwargs"])
     ax.set_title("Behavioral Problems by School (NC TWC Survey 2024)\n"
                  "Lower is Better - Ephesus Has Zero Issues in Multiple Categories",
-                 fontsize=14, fontweight='bold', pad=20)
+                 **_CHART_STYLE["title_kwargs"])
     ax.set_yticks(y)
     ax.set_yticklabels(issues, fontsize=10)
-    ax.set_xlim(0, 70)
-    ax.legend(loc='lower right', fontsize=10)
-
-    # Add grid
-    ax.grid(True, axis='x', alpha=0.3)
-    ax.set_axisbelow(True)
+    ax.legend(**_CHART_STYLE["legend_kwargs"])
 
     # Add annotation box
     props = dict(boxstyle='round', facecolor='#e8f5e9', alpha=0.9, edgecolor=EXCEEDED_COLOR)
@@ -770,109 +912,87 @@ def create_teacher_survey_problems_chart():
             transform=ax.transAxes, fontsize=9, verticalalignment='bottom',
             horizontalalignment='right', bbox=props, fontweight='bold', color=EXCEEDED_COLOR)
 
-    plt.tight_layout()
-    plt.savefig(ASSETS_CHARTS / "teacher_survey_problems.png", dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Created: {ASSETS_CHARTS / 'teacher_survey_problems.png'}")
+    _save_chart(fig, "teacher_survey_problems.png")
 
 
-def create_teacher_survey_community_chart():
+def create_teacher_survey_community_chart(fig=None):
     """
     Create bar chart comparing community engagement metrics.
     Uses NC Teacher Working Conditions Survey 2024 data.
     """
-    # VERIFIED data from NC TWC Survey 2024
-    metrics = [
-        "Parents know\nwhat's going on",
-        "Community\nsupports teachers",
-        "Parents\nsupport teachers",
-        "Encourages parent\ninvolvement",
-        "Good place to\nwork and learn"
-    ]
-    ephesus = [97.67, 95.35, 93.02, 97.67, 97.67]
-    district = [84.86, 82.01, 87.22, 95.28, 91.25]
+    metrics = _COMMUNITY_METRICS
+    ephesus = _COMMUNITY_EPHESUS
+    district = _COMMUNITY_DISTRICT
 
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig, ax = _make_chart_skeleton(fig, grid_axis='y')
+    # Fix the value axis before adding artists
+    ax.set_ylim(0, 110)
 
-    x = range(len(metrics))
+    x = np.arange(len(metrics), dtype=np.float64)
     width = 0.35
 
-    bars_ephesus = ax.bar([i - width/2 for i in x], ephesus, width,
+    bars_ephesus = ax.bar(x - width/2, ephesus, width,
                           label='Ephesus Elementary', color=EPHESUS_COLOR)
-    bars_district = ax.bar([i + width/2 for i in x], district, width,
+    bars_district = ax.bar(x + width/2, district, width,
                            label='CHCCS District', color=NEUTRAL_COLOR)
 
     # Add value labels
-    for bars, values in [(bars_ephesus, ephesus), (bars_district, district)]:
-        for bar, value in zip(bars, values):
-            ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5,
-                    f'{value:.1f}%', ha='center', fontsize=9, fontweight='bold')
-
-    # Add difference annotations for significant gaps
-    for i, (e, d) in enumerate(zip(ephesus, district)):
-        diff = e - d
-        if diff > 5:
-            ax.annotate(f'+{diff:.0f}', xy=(i - width/2, e + 4),
-                        ha='center', fontsize=10, fontweight='bold', color=EXCEEDED_COLOR)
+    ax.bar_label(bars_ephesus, labels=[f'{v:.1f}%' for v in ephesus], padding=2, fontsize=9, fontweight='bold')
+    ax.bar_label(bars_district, labels=[f'{v:.1f}%' for v in district], padding=2, fontsize=9, fontweight='bold')
 
-    ax.set_ylabel("Percent Agreement", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Percent Agreement", **_CHART_STYLE["axis_label_kwargs"])
     ax.set_title("Community Engagement & Teacher Satisfaction (NC TWC Survey 2024)\n"
                  "Ephesus Exceeds District Average in All Categories",
-                 fontsize=14, fontweight='bold', pad=20)
+                 **_CHART_STYLE["title_kwargs"])
     ax.set_xticks(x)
     ax.set_xticklabels(metrics, fontsize=10)
-    ax.set_ylim(0, 110)
-    ax.legend(loc='lower right', fontsize=10)
+    ax.legend(**_CHART_STYLE["legend_kwargs"])
 
-    # Add grid
-    ax.grid(True, axis='y', alpha=0.3)
-    ax.set_axisbelow(True)
+    # Add difference annotations for significant gaps
+    diffs = ephesus - district
+    for i in np.flatnonzero(diffs > 5):
+        ax.annotate(f'+{diffs[i]:.0f}', xy=(i - width/2, ephesus[i] + 4),
+                    ha='center', fontsize=10, fontweight='bold', color=EXCEEDED_COLOR)
 
-    plt.tight_layout()
-    plt.savefig(ASSETS_CHARTS / "teacher_survey_community.png", dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Created: {ASSETS_CHARTS / 'teacher_survey_community.png'}")
+    _save_chart(fig, "teacher_survey_community.png")
 
 
-def create_ephesus_housing_detail():
+def create_ephesus_housing_detail(fig=None):
     projects = ["Greenfield\n(Affordable)", "Park Apartments\n(Market-Rate)",
                 "Longleaf Trace\n(Planned)"]
     units = [149, 414, 150]  # Combined Greenfield = 80 + 69 = 149; Longleaf = 150
     housing_type = ["Affordable", "Market-Rate", "Planned"]
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = _make_chart_skeleton(fig, figsize=(10, 6))
+    # Fix the value axis before adding artists
+    ax.set_ylim(0, 500)
 
     # Create bars with different styles
     colors = [AFFORDABLE_COLOR, MARKET_COLOR, AFFORDABLE_COLOR]
-    bars = ax.bar(projects[:2], units[:2], color=colors[:2], edgecolor='white', linewidth=2)
+    affordable_bar = ax.bar(projects[0], units[0], color=colors[0], edgecolor='white',
+                            linewidth=2, label='Affordable (149 built)')
+    market_bar = ax.bar(projects[1], units[1], color=colors[1], edgecolor='white',
+                        linewidth=2, label='Market-Rate (414 built)')
 
     # Add dashed bar for planned development
-    planned_bar = ax.bar(projects[2], units[2], color=AFFORDABLE_COLOR,
+    planned_bar = ax.bar(projects[2], units[2], color=colors[2],
                          edgecolor='black', linewidth=2, linestyle='--',
-                         hatch='///', alpha=0.6)
+                         hatch='///', alpha=0.6, label='Planned Affordable (150 units)')
 
     # Add value labels
-    for bar, value in zip(bars, units[:2]):
-        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 10,
-                f"{value} units", ha='center', fontweight='bold', fontsize=12)
+    for built_bar in (affordable_bar, market_bar):
+        ax.bar_label(built_bar, fmt='{:.0f} units', padding=4, fontweight='bold', fontsize=12)
 
     # Label for planned
-    ax.text(planned_bar[0].get_x() + planned_bar[0].get_width()/2,
-            planned_bar[0].get_height() + 10,
-            f"{units[2]} units\n(planned)", ha='center', fontweight='bold',
-            fontsize=11, style='italic')
+    ax.bar_label(planned_bar, fmt='{:.0f} units\n(planned)', padding=4, fontweight='bold',
+                 fontsize=11, style='italic')
 
-    ax.set_ylabel("Housing Units", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Housing Units", **_CHART_STYLE["axis_label_kwargs"])
     ax.set_title("Housing Development Near Ephesus Elementary\n563 Built + 150 Planned = 713 Total Units",
-                 fontsize=14, fontweight='bold', pad=20)
-    ax.set_ylim(0, 500)
+                 **_CHART_STYLE["title_kwargs"])
 
-    # Add legend
-    affordable_patch = mpatches.Patch(color=AFFORDABLE_COLOR, label='Affordable (149 built)')
-    market_patch = mpatches.Patch(color=MARKET_COLOR, label='Market-Rate (414 built)')
-    planned_patch = mpatches.Patch(color=AFFORDABLE_COLOR, alpha=0.6, hatch='///',
-                                   label='Planned Affordable (150 units)')
-    ax.legend(handles=[affordable_patch, market_patch, planned_patch], loc='upper right')
+    # Add legend (collected from the labelled bars)
+    ax.legend(loc='upper right')
 
     # Add totals box
     props = dict(boxstyle='round', facecolor='white', alpha=0.9, edgecolor=EPHESUS_COLOR, linewidth=2)
@@ -880,14 +1000,55 @@ def create_ephesus_housing_detail():
     ax.text(0.02, 0.98, textstr, transform=ax.transAxes, fontsize=10,
             verticalalignment='top', horizontalalignment='left', bbox=props)
 
-    plt.tight_layout()
-    plt.savefig(ASSETS_CHARTS / "ephesus_housing_detail.png", dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Created: {ASSETS_CHARTS / 'ephesus_housing_detail.png'}")
+    _save_chart(fig, "ephesus_housing_detail.png")
+
+
+# Charts generated by main(), in report order, with the file each one writes
+CHART_BUILDERS = (
+    # Charts with verified data
+    (create_academic_growth_chart, "academic_growth.png"),                  # All 11 schools, Ephesus #4
+    (create_housing_development_chart, "housing_development.png"),          # All school zones, Ephesus 4th
+    (create_demographics_chart, "demographics.png"),                        # NCES verified data
+    (create_ephesus_housing_detail, "ephesus_housing_detail.png"),          # Detailed Ephesus housing breakdown
+    (create_housing_affordability_boxplot, "housing_affordability.png"),    # Home sale prices by school district (horizontal)
+    (create_housing_price_boxplot, "housing_price_boxplot.png"),            # Home sale prices by school district (vertical)
+
+    # Teacher Survey charts (NC TWC Survey 2024)
+    (create_teacher_survey_conduct_chart, "teacher_survey_conduct.png"),    # Student conduct metrics
+    (create_teacher_survey_problems_chart, "teacher_survey_problems.png"),  # Behavioral problems comparison
+    (create_teacher_survey_community_chart, "teacher_survey_community.png"),  # Community engagement metrics
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _worker_figure():
+    """Figure shared by every chart rendered in this process."""
+    _configure_style()
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _build_chart(build_chart):
+    """Render one chart on the process's shared figure (single-core and pool workers)."""
+    build_chart(_worker_figure())
 
 
 def main():
     """Generate all visualizations with verified data."""
+    parser = argparse.ArgumentParser(description="Generate report charts")
+    parser.add_argument("--singlecore", action="store_true",
+                        help="Render charts one after another in this process "
+                             "(simpler tracebacks when debugging)")
+    parser.add_argument("--svg", action="store_true",
+                        help="Also write an SVG copy of every chart")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-render every chart, even if it is newer than this script")
+    args = parser.parse_args()
+    if args.svg:
+        # Read by _save_chart; the environment is inherited by worker processes
+        os.environ["EPHESUS_CHART_SVG"] = "1"
+
     print("=" * 60)
     print("Save Ephesus Elementary - Generating Visualizations")
     print("Using VERIFIED data from NC Report Cards, NCES, CHCCS, NC TWC Survey")
@@ -897,32 +1058,64 @@ def main():
 
     print("\nGenerating charts with verified data...")
 
-    # Charts with verified data
-    create_academic_growth_chart()      # All 11 schools, Ephesus #4
-    create_housing_development_chart()  # All school zones, Ephesus 4th
-    create_demographics_chart()         # NCES verified data
-    create_ephesus_housing_detail()     # Detailed Ephesus housing breakdown
-    create_housing_affordability_boxplot()  # Home sale prices by school district (horizontal)
-    create_housing_price_boxplot()          # Home sale prices by school district (vertical)
-
-    # Teacher Survey charts (NC TWC Survey 2024)
-    create_teacher_survey_conduct_chart()   # Student conduct metrics
-    create_teacher_survey_problems_chart()  # Behavioral problems comparison
-    create_teacher_survey_community_chart() # Community engagement metrics
+    # All chart data lives in this file, so a chart only needs rebuilding
+    # when the script has changed since the last complete build (by content
+    # hash, since checkouts reset mtimes) or its output is older than it
+    source_hash = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+    hash_path = ASSETS_CHARTS / ".build_hash"
+    hash_matches = hash_path.exists() and hash_path.read_text().strip() == source_hash
+    suffixes = (f".{CHART_FORMAT}", ".svg") if args.svg else (f".{CHART_FORMAT}",)
+    stale = [
+        (build_chart, filename) for build_chart, filename in CHART_BUILDERS
+        if args.force or not hash_matches or not all(
+            _up_to_date((ASSETS_CHARTS / filename).with_suffix(suffix), __file__)
+            for suffix in suffixes)
+    ]
+    builders = [build_chart for build_chart, _ in stale]
+    skipped = len(CHART_BUILDERS) - len(builders)
+    if skipped:
+        print(f"Skipping {skipped} up-to-date chart(s); use --force to rebuild")
+
+    # A pool of one would only add process start-up and pickling overhead
+    max_workers = min(len(builders), os.cpu_count() or 1)
+    if builders and (args.singlecore or max_workers == 1):
+        # One figure is cleared and reused for every chart
+        for build_chart in builders:
+            _build_chart(build_chart)
+    elif builders:
+        # Charts are independent; render them in parallel worker processes
+        # (matplotlib is not thread-safe). Each worker reuses one figure for
+        # all the charts it is handed.
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_build_chart, build_chart) for build_chart in builders]
+            for future in futures:
+                future.result()
+
+    if not hash_matches:
+        hash_path.write_text(source_hash + "\n")
+
+    chart_notes = {
+        "academic_growth.png": "Ephesus #4 of 11",
+        "housing_development.png": "All school zones",
+        "demographics.png": "NCES verified",
+        "ephesus_housing_detail.png": "149 affordable + 414 market + 150 planned",
+        "housing_affordability.png": "Home sale prices - horizontal boxplot",
+        "housing_price_boxplot.png": "Home sale prices - vertical boxplot",
+        "teacher_survey_conduct.png": "Student conduct - 29 pts above district",
+        "teacher_survey_problems.png": "Behavioral problems - 5x fewer conflicts",
+        "teacher_survey_community.png": "Community engagement - 13 pts above",
+    }
 
     print("\n" + "=" * 60)
-    print("All visualizations created with VERIFIED data!")
-    print(f"Charts saved to: {ASSETS_CHARTS}")
-    print("\nCharts generated:")
-    print("  - academic_growth.png (Ephesus #4 of 11)")
-    print("  - housing_development.png (All school zones)")
-    print("  - demographics.png (NCES verified)")
-    print("  - ephesus_housing_detail.png (149 affordable + 414 market + 150 planned)")
-    print("  - housing_affordability.png (Home sale prices - horizontal boxplot)")
-    print("  - housing_price_boxplot.png (Home sale prices - vertical boxplot)")
-    print("  - teacher_survey_conduct.png (Student conduct - 29 pts above district)")
-    print("  - teacher_survey_problems.png (Behavioral problems - 5x fewer conflicts)")
-    print("  - teacher_survey_community.png (Community engagement - 13 pts above)")
+    if not stale:
+        print("No charts needed rebuilding")
+    else:
+        print("All visualizations created with VERIFIED data!")
+        print(f"Charts saved to: {ASSETS_CHARTS}")
+        print("\nCharts generated:")
+        for _, filename in stale:
+            name = Path(filename).with_suffix(f".{CHART_FORMAT}").name
+            print(f"  - {name} ({chart_notes[filename]})")
     print("=" * 60)
 
 